@@ -0,0 +1,15 @@
+-- Reference schema for student_system.py.
+-- roll_no must be unique on its own: restore and bulk add upsert on it
+-- with INSERT ... ON DUPLICATE KEY UPDATE.
+CREATE DATABASE IF NOT EXISTS student_db;
+USE student_db;
+
+CREATE TABLE IF NOT EXISTS students (
+    roll_no VARCHAR(20) PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    marks FLOAT,
+    grade VARCHAR(5)
+);
+
+-- For an existing table without a unique key on roll_no (remove duplicate roll_nos first):
+-- ALTER TABLE students ADD UNIQUE KEY uq_students_roll_no (roll_no);
@@ -3,19 +3,30 @@ student_system.py
 A simple Student Performance Management System:
 - CRUD operations stored in MySQL
 - CSV backup/restore
-- Statistical analysis with pandas (mean, median, topper list)
+- Statistical analysis pushed down to MySQL (mean, median, std, topper list)
 - Marks distribution plot with matplotlib
 """
 
-import mysql.connector
 from mysql.connector import Error
-import pandas as pd
+from mysql.connector.constants import ClientFlag
+from mysql.connector.errorcode import ER_UNKNOWN_STMT_HANDLER
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import MySQLConnectionPool
 import csv
+import logging
 import os
-import statistics
-import matplotlib.pyplot as plt
-from dataclasses import dataclass, asdict
-from typing import Optional, List
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import product
+from dataclasses import dataclass
+from typing import Iterable, Optional, List
+# pandas and matplotlib are imported inside the few methods that use them,
+# so the CRUD menu options start without paying for either.
+
+logger = logging.getLogger(__name__)
 
 # ---------- CONFIG ----------
 DB_CONFIG = {
@@ -25,10 +36,24 @@ DB_CONFIG = {
     'database': 'student_db',
     'raise_on_warnings': True
 }
+POOL_SIZE = 16      # default for library/server callers sharing one Database across workers
+CLI_POOL_SIZE = 1   # the pool opens every connection up front; the single-user menu needs one
+POOL_TIMEOUT = 5    # seconds a caller waits for a free pooled connection before PoolError
 CSV_BACKUP = 'students_backup.csv'
+LOOKUP_TTL = 30  # seconds a cached roll_no lookup may lag writes made by other clients
+LOG_LEVEL = logging.INFO  # DEBUG adds per-batch detail; WARNING keeps only problems
+CSV_COLUMNS = ['roll_no', 'name', 'marks', 'grade']  # backup/restore column order
+
+INSERT_STUDENT_SQL = "INSERT INTO students (roll_no, name, marks, grade) VALUES (%s, %s, %s, %s)"
+# Row-alias upsert: needs MySQL 8.0.19+ (8.4 LTS and 9.x included); MariaDB and MySQL 5.7 lack it.
+# The older VALUES(col) form raises deprecation warning 1287 from 8.0.20 on, which
+# raise_on_warnings turns into an error.
+UPSERT_STUDENT_SQL = (INSERT_STUDENT_SQL +
+                      " AS new ON DUPLICATE KEY UPDATE name=new.name, marks=new.marks, grade=new.grade")
+
 
 # ---------- DATA CLASS ----------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Student:
     roll_no: str
     name: str
@@ -37,172 +62,357 @@ class Student:
 
 # ---------- DATABASE HANDLER ----------
 class Database:
-    def __init__(self, config):
+    def __init__(self, config, pool_size=POOL_SIZE):
         self.config = config
-        self.conn = None
+        self.pool_size = pool_size
+        self.pool = None
+        # the connector's pool raises at once when exhausted; this makes extra callers queue instead
+        self._slots = threading.BoundedSemaphore(pool_size)
+        # underlying connection -> (server session id, {key: cursor}); the pool reuses its
+        # connection objects, so this holds at most pool_size entries
+        self._cursors = {}
 
     def connect(self):
+        # cached cursors (and their prepared statements) die with their server session
+        self._cursors.clear()
         try:
-            self.conn = mysql.connector.connect(**self.config)
+            # keep sessions across checkouts so cached cursors and prepared statements stay valid
+            # FOUND_ROWS: UPDATE rowcount reports matched rows, not just changed ones.
+            # autocommit: sessions outlive checkouts, so a bare SELECT must not leave a snapshot open;
+            # multi-statement work goes through transaction() instead.
+            config = {'client_flags': [ClientFlag.FOUND_ROWS], 'autocommit': True, **self.config}
+            self.pool = MySQLConnectionPool(pool_name="spms", pool_size=self.pool_size,
+                                            pool_reset_session=False, **config)
             return True
         except Error as e:
-            print(f"❌ Database connection error: {e}")
+            logger.error("❌ Database connection error: %s", e)
             return False
 
     def close(self):
-        if self.conn and self.conn.is_connected():
-            self.conn.close()
-
-    def execute(self, query, params=None, commit=False, fetch=False):
-        if not self.conn or not self.conn.is_connected():
-            if not self.connect():
-                raise RuntimeError("DB connection failed")
-        cursor = self.conn.cursor(dictionary=True)
+        # Closes idle connections only; call once every caller is done, since a connection still
+        # checked out is returned to the discarded pool and stays open until garbage-collected.
+        if self.pool:
+            self.pool._remove_connections()
+            self.pool = None
+        self._cursors.clear()
+
+    def check_schema(self):
+        # Read-only: the upserts in restore/bulk add key on roll_no, so warn if it isn't unique.
+        # The reference table definition is in schema.sql; nothing here creates or alters tables.
         try:
-            cursor.execute(query, params or ())
-            if commit:
-                self.conn.commit()
-            if fetch:
-                return cursor.fetchall()
-            return None
+            if not self.execute("SHOW TABLES LIKE 'students'", fetch=True, dict_rows=False):
+                logger.warning("⚠️ Table 'students' not found; create it with schema.sql.")
+            elif not self._roll_no_is_unique():
+                logger.warning("⚠️ students.roll_no has no unique key of its own; restore will add "
+                               "duplicate rows instead of updating them. See schema.sql.")
         except Error as e:
+            logger.warning("⚠️ Could not check the students schema: %s", e)
+
+    def _roll_no_is_unique(self):
+        # Only a unique index on roll_no alone (full column, not a prefix) makes upserts key on it;
+        # a composite one such as UNIQUE(class, roll_no) does not
+        columns = {}
+        for r in self.execute("SHOW INDEX FROM students WHERE Non_unique = 0", fetch=True):
+            columns.setdefault(r['Key_name'], []).append((r['Column_name'], r['Sub_part']))
+        return [('roll_no', None)] in columns.values()
+
+    @contextmanager
+    def connection(self):
+        # Borrow a pooled connection; closing it hands it back to the pool
+        if not self.pool and not self.connect():
+            raise RuntimeError("DB connection failed")
+        if not self._slots.acquire(timeout=POOL_TIMEOUT):
+            raise PoolError(f"No pooled connection became free within {POOL_TIMEOUT}s")
+        try:
+            conn = self.pool.get_connection()
+        except BaseException:
+            self._slots.release()
             raise
+        try:
+            yield conn
         finally:
-            cursor.close()
+            try:
+                conn.close()
+            finally:
+                self._slots.release()
+
+    def _cached_cursor(self, conn, key, **cursor_args):
+        # Pooled wrappers are new on every checkout, so cache on the connection they wrap
+        # (connector-private _cnx). A changed session id means the pool reconnected it and
+        # the old cursors and prepared statements are gone with that session.
+        cnx = getattr(conn, '_cnx', conn)
+        session_id, cursors = self._cursors.get(cnx, (None, None))
+        if session_id != cnx.connection_id:
+            cursors = {}
+            self._cursors[cnx] = (cnx.connection_id, cursors)
+        cursor = cursors.get(key)
+        if cursor is None:
+            cursor = cursors[key] = conn.cursor(**cursor_args)
+        return cursor
+
+    def _drop_cached_cursors(self, conn):
+        self._cursors.pop(getattr(conn, '_cnx', conn), None)
+
+    def execute(self, query, params=None, commit=False, fetch=False, dict_rows=True):
+        with self.connection() as conn:
+            if not fetch:
+                # no result set to hold on to, so one plain cursor per connection serves every write
+                cursor = self._cached_cursor(conn, None)
+                cursor.execute(query, params or ())
+                if commit:
+                    conn.commit()
+                return cursor.rowcount
+            cursor = conn.cursor(dictionary=dict_rows)
+            try:
+                cursor.execute(query, params or ())
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+
+    def execute_prepared(self, query, params=None, commit=False, fetch=False):
+        with self.connection() as conn:
+            cursor = self._cached_cursor(conn, (query, fetch), prepared=True, dictionary=fetch)
+            try:
+                cursor.execute(query, params or ())
+            except Error as e:
+                if e.errno != ER_UNKNOWN_STMT_HANDLER:
+                    raise
+                # a restarted server can hand out the same session id, leaving a dead handle: re-prepare once
+                self._drop_cached_cursors(conn)
+                cursor = self._cached_cursor(conn, (query, fetch), prepared=True, dictionary=fetch)
+                cursor.execute(query, params or ())
+            if commit:
+                conn.commit()
+            if fetch:
+                return cursor.fetchall()
+            return cursor.rowcount
+
+    def iter_chunks(self, query, params=None, size=10_000):
+        # Stream a large result set as lists of tuples without buffering it all
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params or ())
+                while (chunk := cursor.fetchmany(size)):
+                    yield chunk
+            finally:
+                # drain anything left if the caller stopped early, so the pooled connection is reusable
+                if conn.unread_result:
+                    conn.consume_results()
+                cursor.close()
+
+    @contextmanager
+    def transaction(self):
+        # One explicit transaction on one connection: commit on success, roll back on error
+        with self.connection() as conn:
+            conn.start_transaction()
+            cursor = conn.cursor()
+            try:
+                yield cursor
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def executemany(self, query, seq_params):
+        with self.transaction() as cursor:
+            # Connector/Python rewrites INSERT ... VALUES into a single multi-row INSERT
+            cursor.executemany(query, seq_params)
+            return cursor.rowcount
+
+# ---------- DISPLAY HELPERS ----------
+def format_table(rows: List[dict]) -> str:
+    # Plain-text table laid out like DataFrame.to_string(index=False)
+    cols = list(rows[0])
+    cells = [[str(r[c]) for c in cols] for r in rows]
+    widths = [max(len(c), *(len(row[i]) for row in cells)) for i, c in enumerate(cols)]
+    lines = [' '.join(c.rjust(w) for c, w in zip(cols, widths))]
+    lines += [' '.join(v.rjust(w) for v, w in zip(row, widths)) for row in cells]
+    return '\n'.join(lines)
 
 # ---------- STUDENT MANAGER ----------
 class StudentManager:
+    # UPDATE text for every combination of (name, marks, grade) being set, so each
+    # shape is one fixed string and its prepared statement is reused
+    _UPDATE_SQL = {
+        flags: "UPDATE students SET "
+               + ", ".join(f"{col}=%s" for col, on in zip(('name', 'marks', 'grade'), flags) if on)
+               + " WHERE roll_no = %s"
+        for flags in product((False, True), repeat=3) if any(flags)
+    }
+
     def __init__(self, db: Database):
         self.db = db
+        # Per-instance cache of roll_no lookups. Writes through this manager clear it; writes by
+        # other managers, workers or processes are not seen until the entry's LOOKUP_TTL window ends.
+        self._get_by_roll = lru_cache(maxsize=512)(self._query_student)
 
     # Create (Add)
     def add_student(self, student: Student):
         try:
-            q = "INSERT INTO students (roll_no, name, marks, grade) VALUES (%s, %s, %s, %s)"
-            self.db.execute(q, (student.roll_no, student.name, student.marks, student.grade), commit=True)
-            print("✅ Student added.")
+            self.db.execute_prepared(INSERT_STUDENT_SQL, (student.roll_no, student.name, student.marks, student.grade), commit=True)
+            self._get_by_roll.cache_clear()
+            logger.info("✅ Student added.")
         except Error as e:
-            print("❌ Error adding student:", e)
+            logger.error("❌ Error adding student: %s", e)
+
+    # Create (bulk): one batched statement in one transaction
+    def add_students(self, students: Iterable[Student], *, upsert=False):
+        params = [(s.roll_no, s.name, s.marks, s.grade) for s in students]
+        if not params:
+            logger.info("No students to add.")
+            return
+        try:
+            self.db.executemany(UPSERT_STUDENT_SQL if upsert else INSERT_STUDENT_SQL, params)
+            self._get_by_roll.cache_clear()
+            logger.info("✅ %d student(s) added.", len(params))
+        except Error as e:
+            logger.error("❌ Error adding students (none were saved): %s", e)
+
+    # Read (all rows, no display)
+    def _fetch_students(self) -> List[dict]:
+        q = "SELECT * FROM students ORDER BY roll_no"
+        return self.db.execute(q, fetch=True)
 
     # Read (View all)
     def view_students(self) -> List[dict]:
         try:
-            q = "SELECT * FROM students ORDER BY roll_no"
-            rows = self.db.execute(q, fetch=True)
+            rows = self._fetch_students()
             if not rows:
-                print("No students found.")
+                logger.info("No students found.")
                 return []
+            import pandas as pd
             df = pd.DataFrame(rows)
             print(df.to_string(index=False))
             return rows
         except Error as e:
-            print("❌ Error fetching students:", e)
+            logger.error("❌ Error fetching students: %s", e)
             return []
 
+    # Read (single, uncached)
+    def _query_student(self, roll_no: str, _window: int = 0) -> Optional[dict]:
+        # _window only varies the cache key so entries expire; the query ignores it
+        q = "SELECT * FROM students WHERE roll_no = %s"
+        rows = self.db.execute_prepared(q, (roll_no,), fetch=True)
+        return rows[0] if rows else None
+
     # Read (single)
     def get_student_by_roll(self, roll_no: str) -> Optional[dict]:
+        # errors propagate out of the cached call, so failures are never cached
         try:
-            q = "SELECT * FROM students WHERE roll_no = %s"
-            rows = self.db.execute(q, (roll_no,), fetch=True)
-            return rows[0] if rows else None
+            row = self._get_by_roll(roll_no, int(time.monotonic() // LOOKUP_TTL))
+            # hand out a copy so callers can't edit the cached row
+            return dict(row) if row else None
         except Error as e:
-            print("❌ Error:", e)
+            logger.error("❌ Error: %s", e)
             return None
 
     # Update
     def update_student(self, roll_no: str, *, name=None, marks=None, grade=None):
-        existing = self.get_student_by_roll(roll_no)
-        if not existing:
-            print("❌ Student not found.")
-            return
-        # build dynamic update
-        updates = []
-        params = []
-        if name is not None:
-            updates.append("name=%s"); params.append(name)
-        if marks is not None:
-            updates.append("marks=%s"); params.append(marks)
-        if grade is not None:
-            updates.append("grade=%s"); params.append(grade)
-        if not updates:
-            print("Nothing to update.")
+        fields = (name, marks, grade)
+        shape = tuple(v is not None for v in fields)
+        if not any(shape):
+            logger.info("Nothing to update.")
             return
-        params.append(roll_no)
-        q = f"UPDATE students SET {', '.join(updates)} WHERE roll_no = %s"
+        q = self._UPDATE_SQL[shape]
+        params = tuple(v for v in fields if v is not None) + (roll_no,)
         try:
-            self.db.execute(q, tuple(params), commit=True)
-            print("✅ Student updated.")
+            if not self.db.execute_prepared(q, params, commit=True):
+                logger.error("❌ Student not found.")
+                return
+            self._get_by_roll.cache_clear()
+            logger.info("✅ Student updated.")
         except Error as e:
-            print("❌ Error updating student:", e)
+            logger.error("❌ Error updating student: %s", e)
 
     # Delete
     def delete_student(self, roll_no: str):
         try:
             q = "DELETE FROM students WHERE roll_no = %s"
-            self.db.execute(q, (roll_no,), commit=True)
-            print("✅ Student deleted (if existed).")
+            self.db.execute_prepared(q, (roll_no,), commit=True)
+            self._get_by_roll.cache_clear()
+            logger.info("✅ Student deleted (if existed).")
         except Error as e:
-            print("❌ Error deleting student:", e)
+            logger.error("❌ Error deleting student: %s", e)
 
-    # CSV backup
+    # CSV backup (streamed straight from the cursor)
     def backup_to_csv(self, path=CSV_BACKUP):
-        rows = self.view_students()
-        if not rows:
-            print("Nothing to backup.")
-            return
-        keys = rows[0].keys()
+        q = "SELECT roll_no, name, marks, grade FROM students ORDER BY roll_no"
+        chunks = self.db.iter_chunks(q)
         try:
-            with open(path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=keys)
-                writer.writeheader()
-                writer.writerows(rows)
-            print(f"✅ Backup saved to {path}")
+            first = next(chunks, None)
+            if not first:
+                logger.info("Nothing to backup.")
+                return
+            with open(path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+                # plain tuples straight from fetchmany: no per-cell dict lookups
+                writer = csv.writer(f, quoting=csv.QUOTE_MINIMAL)
+                writer.writerow(CSV_COLUMNS)
+                writer.writerows(first)
+                for chunk in chunks:
+                    writer.writerows(chunk)
+            logger.info("✅ Backup saved to %s", path)
         except Exception as e:
-            print("❌ Backup error:", e)
+            logger.error("❌ Backup error: %s", e)
+        finally:
+            chunks.close()
 
-    # CSV restore (simple replace-inserts skipping duplicates on roll_no)
+    # CSV restore (batched upsert on roll_no)
     def restore_from_csv(self, path=CSV_BACKUP):
         if not os.path.exists(path):
-            print("❌ CSV file not found.")
+            logger.error("❌ CSV file not found.")
             return
+        import pandas as pd
         try:
-            df = pd.read_csv(path)
+            df = pd.read_csv(path, engine='c', usecols=CSV_COLUMNS,
+                             dtype={'roll_no': 'string', 'name': 'string', 'marks': 'float64', 'grade': 'string'})
         except Exception as e:
-            print("❌ Could not read CSV:", e)
+            logger.error("❌ Could not read CSV: %s", e)
             return
-        for _, row in df.iterrows():
-            try:
-                # Upsert-like: try insert, if duplicate roll_no then update
-                q = "INSERT INTO students (roll_no, name, marks, grade) VALUES (%s,%s,%s,%s)"
-                self.db.execute(q, (row['roll_no'], row['name'], float(row['marks']), row['grade']), commit=True)
-            except Error as e:
-                # attempt update on duplicate
-                try:
-                    q2 = "UPDATE students SET name=%s, marks=%s, grade=%s WHERE roll_no=%s"
-                    self.db.execute(q2, (row['name'], float(row['marks']), row['grade'], row['roll_no']), commit=True)
-                except Error as e2:
-                    print("❌ Error restoring row:", e2)
-        print("✅ Restore complete.")
-
-    # Statistics using pandas
-    def stats(self):
-        rows = self.db.execute("SELECT roll_no, name, marks FROM students", fetch=True)
+        # dtypes are fixed at parse time; empty cells (pd.NA / NaN) become None so they bind as NULL
+        cols = df[CSV_COLUMNS]
+        rows = cols.astype(object).where(cols.notna(), None).to_numpy().tolist()
         if not rows:
-            print("No data to compute stats.")
+            logger.info("Nothing to restore.")
+            return
+        # Upsert all rows in one batched statement: insert, or update on duplicate roll_no
+        try:
+            # all-or-nothing: a bad row rolls the whole restore back
+            self.db.executemany(UPSERT_STUDENT_SQL, rows)
+            logger.debug("Restore upserted %d row(s) from %s", len(rows), path)
+            self._get_by_roll.cache_clear()
+        except Error as e:
+            logger.error("❌ Error restoring rows: %s", e)
+            return
+        logger.info("✅ Restore complete.")
+
+    # Statistics computed in MySQL (only the aggregates cross the wire)
+    def stats(self):
+        n, mean_val, std_dev = self.db.execute(
+            "SELECT COUNT(marks), AVG(marks), STDDEV_SAMP(marks) FROM students",
+            fetch=True, dict_rows=False)[0]
+        if not n:
+            logger.info("No data to compute stats.")
             return
-        df = pd.DataFrame(rows)
-        # ensure marks numeric
-        df['marks'] = pd.to_numeric(df['marks'], errors='coerce')
-        mean_val = df['marks'].mean()
-        median_val = df['marks'].median()
-        std_dev = df['marks'].std()
+        # median: average of the one or two middle values
+        (median_val,) = self.db.execute(
+            "SELECT AVG(marks) FROM (SELECT marks FROM students WHERE marks IS NOT NULL "
+            "ORDER BY marks LIMIT %s OFFSET %s) AS mid",
+            (2 - n % 2, (n - 1) // 2), fetch=True, dict_rows=False)[0]
         # toppers (top 3)
-        toppers = df.nlargest(3, 'marks')[['roll_no', 'name', 'marks']]
+        toppers = self.db.execute(
+            "SELECT roll_no, name, marks FROM students WHERE marks IS NOT NULL ORDER BY marks DESC LIMIT 3",
+            fetch=True)
+        mean_val = float(mean_val)
+        median_val = float(median_val)
+        std_dev = float(std_dev) if std_dev is not None else None
         print(f"Mean marks: {mean_val:.2f}")
         print(f"Median marks: {median_val:.2f}")
-        print(f"Std deviation: {std_dev:.2f}" if not pd.isna(std_dev) else "Std deviation: N/A")
+        print(f"Std deviation: {std_dev:.2f}" if std_dev is not None else "Std deviation: N/A")
         print("\nTopper(s):")
-        print(toppers.to_string(index=False))
+        print(format_table(toppers))
 
         return {
             'mean': mean_val,
@@ -211,18 +421,19 @@ class StudentManager:
             'toppers': toppers
         }
 
-    # Plot marks distribution
+    # Plot marks distribution (binned in MySQL: one row per 10-mark bucket)
     def plot_marks_distribution(self):
-        rows = self.db.execute("SELECT marks FROM students", fetch=True)
+        # exactly 100 joins the 90-100 bar; out-of-range marks keep their own bars so they stay visible
+        rows = self.db.execute(
+            "SELECT CASE WHEN marks = 100 THEN 9 ELSE FLOOR(marks / 10) END AS bucket, COUNT(*) FROM students "
+            "WHERE marks IS NOT NULL GROUP BY bucket ORDER BY bucket",
+            fetch=True, dict_rows=False)
         if not rows:
-            print("No marks to plot.")
-            return
-        marks = [r['marks'] for r in rows if r['marks'] is not None]
-        if not marks:
-            print("No marks to plot.")
+            logger.info("No marks to plot.")
             return
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(8,5))
-        plt.hist(marks, bins=10)
+        plt.bar([int(b) * 10 for b, _ in rows], [n for _, n in rows], width=10, align='edge')
         plt.title("Marks Distribution")
         plt.xlabel("Marks")
         plt.ylabel("Number of Students")
@@ -246,11 +457,11 @@ def input_marks():
     s = input("Enter Marks (0-100): ").strip()
     try:
         m = float(s)
-        if m < 0 or m > 100:
-            raise ValueError("Marks must be between 0 and 100.")
-        return m
     except ValueError:
-        raise ValueError("Invalid marks; enter a number between 0 and 100.")
+        raise ValueError("Invalid marks; enter a number between 0 and 100.") from None
+    if not 0.0 <= m <= 100.0:
+        raise ValueError("Marks must be between 0 and 100.")
+    return m
 
 def input_grade():
     g = input("Enter Grade (e.g. A, B+, C): ").strip()
@@ -271,6 +482,7 @@ def main_menu(manager: StudentManager):
         print("7. Restore from CSV")
         print("8. Statistics (mean, median, toppers)")
         print("9. Plot Marks Distribution")
+        print("10. Bulk Add Students")
         print("0. Exit")
         choice = input("Choose an option: ").strip()
         try:
@@ -287,7 +499,7 @@ def main_menu(manager: StudentManager):
                 roll = input_roll()
                 s = manager.get_student_by_roll(roll)
                 if s:
-                    print(pd.DataFrame([s]).to_string(index=False))
+                    print(format_table([s]))
                 else:
                     print("Not found.")
             elif choice == '4':
@@ -315,6 +527,20 @@ def main_menu(manager: StudentManager):
                 manager.stats()
             elif choice == '9':
                 manager.plot_marks_distribution()
+            elif choice == '10':
+                print("Enter students one by one; leave Roll No blank to finish.")
+                students = []
+                while (roll := input("Enter Roll No: ").strip()):
+                    try:
+                        name = input_name()
+                        marks = input_marks()
+                        grade = input_grade()
+                    except ValueError as ve:
+                        # keep what was already entered; only this student is typed again
+                        print(f"❌ Input error: {ve} Enter that student again, starting with the Roll No.")
+                        continue
+                    students.append(Student(roll_no=roll, name=name, marks=marks, grade=grade))
+                manager.add_students(students)
             elif choice == '0':
                 print("Exiting...")
                 break
@@ -327,10 +553,12 @@ def main_menu(manager: StudentManager):
 
 # ---------- RUN ----------
 if __name__ == "__main__":
-    db = Database(DB_CONFIG)
+    logging.basicConfig(level=LOG_LEVEL, format="%(message)s", stream=sys.stdout)
+    db = Database(DB_CONFIG, pool_size=CLI_POOL_SIZE)
     if not db.connect():
         print("Cannot continue without DB. Check DB credentials and server.")
         exit(1)
+    db.check_schema()
     manager = StudentManager(db)
     try:
         main_menu(manager)